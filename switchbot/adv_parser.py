@@ -149,20 +149,21 @@ def parse_advertisement_data(
 ) -> SwitchBotAdvertisement | None:
     """Parse advertisement data."""
     service_data = advertisement_data.service_data
+    manufacturer_data = advertisement_data.manufacturer_data
 
     _service_data = None
-    for uuid in SERVICE_DATA_ORDER:
-        if uuid in service_data:
-            _service_data = service_data[uuid]
-            break
+    if service_data:
+        for uuid in SERVICE_DATA_ORDER:
+            if (_service_data := service_data.get(uuid)) is not None:
+                break
 
     _mfr_data = None
     _mfr_id = None
-    for mfr_id in MFR_DATA_ORDER:
-        if mfr_id in advertisement_data.manufacturer_data:
-            _mfr_id = mfr_id
-            _mfr_data = advertisement_data.manufacturer_data[mfr_id]
-            break
+    if manufacturer_data:
+        for mfr_id in MFR_DATA_ORDER:
+            if (_mfr_data := manufacturer_data.get(mfr_id)) is not None:
+                _mfr_id = mfr_id
+                break
 
     if _mfr_data is None and _service_data is None:
         return None
@@ -188,7 +189,7 @@ def parse_advertisement_data(
     )
 
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=1024)
 def _parse_data(
     _service_data: bytes | None,
     _mfr_data: bytes | None,
@@ -211,23 +212,17 @@ def _parse_data(
         return None
 
     _isEncrypted = bool(_service_data[0] & 0b10000000) if _service_data else False
+    type_data = SUPPORTED_TYPES.get(_model)
+    model_data = type_data["func"](_service_data, _mfr_data) if type_data else None
+
     data = {
         "rawAdvData": _service_data,
-        "data": {},
+        "data": model_data or {},
         "model": _model,
         "isEncrypted": _isEncrypted,
     }
-
-    type_data = SUPPORTED_TYPES.get(_model)
-    if type_data:
-        model_data = type_data["func"](_service_data, _mfr_data)
-        if model_data:
-            data.update(
-                {
-                    "modelFriendlyName": type_data["modelFriendlyName"],
-                    "modelName": type_data["modelName"],
-                    "data": model_data,
-                }
-            )
+    if model_data:
+        data["modelFriendlyName"] = type_data["modelFriendlyName"]
+        data["modelName"] = type_data["modelName"]
 
     return data
@@ -14,10 +14,11 @@ def process_wohand(data: bytes | None, mfr_data: bytes | None) -> dict[str, bool
             "battery": None,
         }
 
-    _switch_mode = bool(data[1] & 0b10000000)
+    _mode_byte = data[1]
+    _switch_mode = _mode_byte >= 0b10000000
 
     return {
         "switchMode": _switch_mode,
-        "isOn": not bool(data[1] & 0b01000000) if _switch_mode else False,
+        "isOn": _switch_mode and not _mode_byte & 0b01000000,
         "battery": data[2] & 0b01111111,
     }
@@ -13,10 +13,11 @@ def process_wocurtain(
     else:
         return {}
 
-    _position = max(min(device_data[0] & 0b01111111, 100), 0)
-    _in_motion = bool(device_data[0] & 0b10000000)
-    _light_level = (device_data[1] >> 4) & 0b00001111
-    _device_chain = device_data[1] & 0b00000111
+    _motion_byte, _light_byte = device_data[0], device_data[1]
+    _position = min(_motion_byte & 0b01111111, 100)
+    _in_motion = _motion_byte >= 0b10000000
+    _light_level = _light_byte >> 4
+    _device_chain = _light_byte & 0b00000111
 
     return {
         "calibration": bool(data[1] & 0b01000000) if data else None,
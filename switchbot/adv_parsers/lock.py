@@ -13,8 +13,9 @@ def process_wolock(data: bytes | None, mfr_data: bytes | None) -> dict[str, bool
     if mfr_data is None:
         return {}
 
-    _LOGGER.debug("mfr_data: %s", mfr_data.hex())
-    _LOGGER.debug("data: %s", data.hex())
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("mfr_data: %s", mfr_data.hex())
+        _LOGGER.debug("data: %s", data.hex() if data else None)
 
     return {
         "battery": data[2] & 0b01111111 if data else None,
@@ -7,7 +7,6 @@ from typing import Any
 from .device import ColorMode, SwitchbotDevice
 
 _LOGGER = logging.getLogger(__name__)
-import asyncio
 import time
 
 from ..models import SwitchBotAdvertisement
@@ -107,4 +106,4 @@ class SwitchbotSequenceBaseLight(SwitchbotBaseLight):
             new_state,
         )
         if current_state != new_state:
-            asyncio.ensure_future(self.update())
+            self._create_background_task(self.update())
@@ -84,16 +84,16 @@ class Switchbot(SwitchbotDeviceOverrideStateDuringConnection):
         self, switch_mode: bool = False, strength: int = 100, inverse: bool = False
     ) -> bool:
         """Change bot mode."""
-        mode_key = format(switch_mode, "b") + format(inverse, "b")
-        strength_key = f"{strength:0{2}x}"  # to hex with padding to double digit
-        result = await self._send_command(DEVICE_SET_MODE_KEY + strength_key + mode_key)
+        mode_key = f"{switch_mode:d}{inverse:d}"
+        result = await self._send_command(
+            f"{DEVICE_SET_MODE_KEY}{strength:02X}{mode_key}"
+        )
         return self._check_command_result(result, 0, {1})
 
     @update_after_operation
     async def set_long_press(self, duration: int = 0) -> bool:
         """Set bot long press duration."""
-        duration_key = f"{duration:0{2}x}"  # to hex with padding to double digit
-        result = await self._send_command(DEVICE_SET_EXTENDED_KEY + "08" + duration_key)
+        result = await self._send_command(f"{DEVICE_SET_EXTENDED_KEY}08{duration:02X}")
         return self._check_command_result(result, 0, {1})
 
     async def get_basic_info(self) -> dict[str, Any] | None:
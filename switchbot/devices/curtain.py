@@ -26,10 +26,26 @@ CURTAIN_EXT_SUM_KEY = f"{REQ_HEADER}460401"
 CURTAIN_EXT_ADV_KEY = f"{REQ_HEADER}460402"
 CURTAIN_EXT_CHAIN_INFO_KEY = f"{REQ_HEADER}468101"
 
+_CHARGE_STATES = (
+    "not_charging",
+    "charging_by_adapter",
+    "charging_by_solar",
+    "fully_charged",
+    "solar_not_charging",
+    "charging_error",
+)
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _state_of_charge(value: int) -> str:
+    """Return the charge state name for the raw value."""
+    if value < len(_CHARGE_STATES):
+        return _CHARGE_STATES[value]
+    return "unknown"
+
+
 class SwitchbotCurtain(SwitchbotDevice):
     """Representation of a Switchbot Curtain."""
 
@@ -81,9 +97,8 @@ class SwitchbotCurtain(SwitchbotDevice):
     async def set_position(self, position: int) -> bool:
         """Send position command (0-100) to device."""
         position = (100 - position) if self._reverse else position
-        hex_position = "%0.2X" % position
         return await self._send_multiple_commands(
-            [key + hex_position for key in POSITION_KEYS]
+            [f"{key}{position:02X}" for key in POSITION_KEYS]
         )
 
     def get_position(self) -> Any:
@@ -96,7 +111,7 @@ class SwitchbotCurtain(SwitchbotDevice):
         if not (_data := await self._get_basic_info()):
             return None
 
-        _position = max(min(_data[6], 100), 0)
+        _position = min(_data[6], 100)
         return {
             "battery": _data[1],
             "firmware": _data[2] / 10.0,
@@ -161,19 +176,10 @@ class SwitchbotCurtain(SwitchbotDevice):
             _LOGGER.error("%s: Unsuccessful, please try again", self.name)
             return None
 
-        _state_of_charge = [
-            "not_charging",
-            "charging_by_adapter",
-            "charging_by_solar",
-            "fully_charged",
-            "solar_not_charging",
-            "charging_error",
-        ]
-
         self.ext_info_adv["device0"] = {
             "battery": _data[1],
             "firmware": _data[2] / 10.0,
-            "stateOfCharge": _state_of_charge[_data[3]],
+            "stateOfCharge": _state_of_charge(_data[3]),
         }
 
         # If grouped curtain device present.
@@ -181,7 +187,7 @@ class SwitchbotCurtain(SwitchbotDevice):
             self.ext_info_adv["device1"] = {
                 "battery": _data[4],
                 "firmware": _data[5] / 10.0,
-                "stateOfCharge": _state_of_charge[_data[6]],
+                "stateOfCharge": _state_of_charge(_data[6]),
             }
 
         return self.ext_info_adv
@@ -7,7 +7,8 @@ import logging
 import time
 from dataclasses import replace
 from enum import Enum
-from typing import Any, Callable, TypeVar, cast
+from functools import lru_cache
+from typing import Any, Callable, Coroutine, TypeVar, cast
 from uuid import UUID
 
 import async_timeout
@@ -61,6 +62,12 @@ class ColorMode(Enum):
 # values.
 PASSIVE_POLL_INTERVAL = 60 * 60 * 24
 
+# Scan results shared by all devices, keyed by adapter index, so
+# devices polled together reuse a single scan instead of each
+# starting their own.
+_SCAN_CACHE: dict[int, tuple[float, dict[str, SwitchBotAdvertisement]]] = {}
+_SCAN_LOCK = asyncio.Lock()
+
 
 class CharacteristicMissingError(Exception):
     """Raised when a characteristic is missing."""
@@ -85,6 +92,14 @@ READ_CHAR_UUID = _sb_uuid(comms_type="rx")
 WRITE_CHAR_UUID = _sb_uuid(comms_type="tx")
 
 
+@lru_cache(maxsize=256)
+def _encode_command(key: str, password_encoded: str | None) -> bytes:
+    """Return the bytes sent to the device for a hex command key."""
+    if password_encoded is not None:
+        key = KEY_PASSWORD_PREFIX + key[3] + password_encoded + key[4:]
+    return bytes.fromhex(key)
+
+
 WrapFuncType = TypeVar("WrapFuncType", bound=Callable[..., Any])
 
 
@@ -121,6 +136,7 @@ class SwitchbotBaseDevice:
         **kwargs: Any,
     ) -> None:
         """Switchbot base class constructor."""
+        self._interface_index = interface
         self._interface = f"hci{interface}"
         self._device = device
         self._sb_adv_data: SwitchBotAdvertisement | None = None
@@ -143,6 +159,7 @@ class SwitchbotBaseDevice:
         self.loop = asyncio.get_event_loop()
         self._callbacks: list[Callable[[], None]] = []
         self._notify_future: asyncio.Future[bytearray] | None = None
+        self._background_tasks: set[asyncio.Task[Any]] = set()
         self._last_full_update: float = -PASSIVE_POLL_INTERVAL
 
     def advertisement_changed(self, advertisement: SwitchBotAdvertisement) -> bool:
@@ -153,19 +170,15 @@ class SwitchbotBaseDevice:
             or advertisement.data != self._sb_adv_data.data
         )
 
-    def _commandkey(self, key: str) -> str:
+    def _commandkey(self, key: str) -> bytes:
         """Add password to key if set."""
-        if self._password_encoded is None:
-            return key
-        key_action = key[3]
-        key_suffix = key[4:]
-        return KEY_PASSWORD_PREFIX + key_action + self._password_encoded + key_suffix
+        return _encode_command(key, self._password_encoded)
 
     async def _send_command(self, key: str, retry: int | None = None) -> bytes | None:
         """Send command to device and read response."""
         if retry is None:
             retry = self._retry_count
-        command = bytearray.fromhex(self._commandkey(key))
+        command = self._commandkey(key)
         _LOGGER.debug("%s: Scheduling command %s", self.name, command.hex())
         max_attempts = retry + 1
         if self._operation_lock.locked():
@@ -321,7 +334,7 @@ class SwitchbotBaseDevice:
 
     def _disconnect_from_timer(self):
         """Disconnect from device."""
-        if self._operation_lock.locked() and self._client.is_connected:
+        if self._operation_lock.locked() and self._client and self._client.is_connected:
             _LOGGER.debug(
                 "%s: Operation in progress, resetting disconnect timer; RSSI: %s",
                 self.name,
@@ -330,7 +343,13 @@ class SwitchbotBaseDevice:
             self._reset_disconnect_timer()
             return
         self._cancel_disconnect_timer()
-        asyncio.create_task(self._execute_timed_disconnect())
+        self._create_background_task(self._execute_timed_disconnect())
+
+    def _create_background_task(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Run a coroutine in the background and hold a reference until done."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
     def _cancel_disconnect_timer(self):
         """Cancel disconnect timer."""
@@ -472,14 +491,17 @@ class SwitchbotBaseDevice:
         if retry is None:
             retry = self._retry_count
 
-        if interface:
-            _interface: int = interface
-        else:
-            _interface = int(self._interface.replace("hci", ""))
+        _interface: int = interface or self._interface_index
 
-        _data = await GetSwitchbotDevices(interface=_interface).discover(
-            retry=retry, scan_timeout=self._scan_timeout
-        )
+        async with _SCAN_LOCK:
+            cached = _SCAN_CACHE.get(_interface)
+            if cached and time.monotonic() - cached[0] < self._scan_timeout:
+                _data = cached[1]
+            else:
+                _data = await GetSwitchbotDevices(interface=_interface).discover(
+                    retry=retry, scan_timeout=self._scan_timeout
+                )
+                _SCAN_CACHE[_interface] = (time.monotonic(), _data)
 
         if self._device.address in _data:
             self._sb_adv_data = _data[self._device.address]
@@ -642,4 +664,4 @@ class SwitchbotSequenceDevice(SwitchbotDevice):
             new_state,
         )
         if current_state != new_state:
-            asyncio.ensure_future(self.update())
+            self._create_background_task(self.update())
@@ -6,10 +6,11 @@ import asyncio
 import logging
 
 import bleak
+from bleak import BleakError
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
-from .adv_parser import parse_advertisement_data
+from .adv_parser import MFR_DATA_ORDER, SERVICE_DATA_ORDER, parse_advertisement_data
 from .const import DEFAULT_RETRY_COUNT, DEFAULT_RETRY_TIMEOUT, DEFAULT_SCAN_TIMEOUT
 from .models import SwitchBotAdvertisement
 
@@ -24,6 +25,10 @@ class GetSwitchbotDevices:
         """Get switchbot devices class constructor."""
         self._interface = f"hci{interface}"
         self._adv_data: dict[str, SwitchBotAdvertisement] = {}
+        self._adv_data_by_model: dict[str, dict[str, SwitchBotAdvertisement]] = {}
+        self._pending: dict[str, tuple[BLEDevice, AdvertisementData]] = {}
+        self._discover_lock = asyncio.Lock()
+        self._discovered = False
 
     def detection_callback(
         self,
@@ -31,57 +36,88 @@ class GetSwitchbotDevices:
         advertisement_data: AdvertisementData,
     ) -> None:
         """Callback for device detection."""
-        discovery = parse_advertisement_data(device, advertisement_data)
-        if discovery:
-            self._adv_data[discovery.address] = discovery
+        # Parsing is deferred until the scan has stopped so the callback
+        # returns to the BLE stack as quickly as possible. Only the latest
+        # advertisement per device is kept, so skip ones without SwitchBot
+        # data to avoid replacing an earlier usable one.
+        if advertisement_data.service_data.keys().isdisjoint(
+            SERVICE_DATA_ORDER
+        ) and advertisement_data.manufacturer_data.keys().isdisjoint(MFR_DATA_ORDER):
+            return
+        self._pending[device.address] = (device, advertisement_data)
+
+    def _process_pending(self) -> None:
+        """Parse the advertisements collected during the scan."""
+        pending = self._pending
+        self._pending = {}
+        for device, advertisement_data in pending.values():
+            discovery = parse_advertisement_data(device, advertisement_data)
+            if not discovery:
+                continue
+            address = discovery.address
+            self._adv_data[address] = discovery
+            model = discovery.data["model"]
+            self._adv_data_by_model.setdefault(model, {})[address] = discovery
 
     async def discover(
         self, retry: int = DEFAULT_RETRY_COUNT, scan_timeout: int = DEFAULT_SCAN_TIMEOUT
     ) -> dict:
         """Find switchbot devices and their advertisement data."""
+        for attempt in range(retry + 1):
+            devices = bleak.BleakScanner(
+                # TODO: Find new UUIDs to filter on. For example, see
+                # https://github.com/OpenWonderLabs/SwitchBotAPI-BLE/blob/4ad138bb09f0fbbfa41b152ca327a78c1d0b6ba9/devicetypes/meter.md
+                detection_callback=self.detection_callback,
+                # Active scanning is needed to receive the scan response,
+                # which carries the service data most parsers rely on.
+                scanning_mode="active",
+                adapter=self._interface,
+            )
 
-        devices = None
-        devices = bleak.BleakScanner(
-            # TODO: Find new UUIDs to filter on. For example, see
-            # https://github.com/OpenWonderLabs/SwitchBotAPI-BLE/blob/4ad138bb09f0fbbfa41b152ca327a78c1d0b6ba9/devicetypes/meter.md
-            adapter=self._interface,
-        )
-        devices.register_detection_callback(self.detection_callback)
-
-        async with CONNECT_LOCK:
-            await devices.start()
-            await asyncio.sleep(scan_timeout)
-            await devices.stop()
-
-        if devices is None:
-            if retry < 1:
-                _LOGGER.error(
-                    "Scanning for Switchbot devices failed. Stop trying", exc_info=True
+            try:
+                async with CONNECT_LOCK:
+                    await devices.start()
+                    await asyncio.sleep(scan_timeout)
+                    await devices.stop()
+            except BleakError:
+                if attempt == retry:
+                    _LOGGER.error(
+                        "Scanning for Switchbot devices failed. Stop trying",
+                        exc_info=True,
+                    )
+                    break
+
+                _LOGGER.warning(
+                    "Error scanning for Switchbot devices. Retrying (remaining: %d)",
+                    retry - attempt,
                 )
-                return self._adv_data
+                await asyncio.sleep(DEFAULT_RETRY_TIMEOUT)
+            else:
+                self._discovered = True
+                break
 
-            _LOGGER.warning(
-                "Error scanning for Switchbot devices. Retrying (remaining: %d)",
-                retry,
-            )
-            await asyncio.sleep(DEFAULT_RETRY_TIMEOUT)
-            return await self.discover(retry - 1, scan_timeout)
+        self._process_pending()
 
         return self._adv_data
 
+    async def _ensure_discovered(self) -> None:
+        """Run a discovery if none has succeeded yet."""
+        if self._discovered:
+            return
+        async with self._discover_lock:
+            # Check again while holding the lock, concurrent callers
+            # share the result of the first scan
+            if not self._discovered:
+                await self.discover()
+
     async def _get_devices_by_model(
         self,
         model: str,
     ) -> dict:
         """Get switchbot devices by type."""
-        if not self._adv_data:
-            await self.discover()
+        await self._ensure_discovered()
 
-        return {
-            address: adv
-            for address, adv in self._adv_data.items()
-            if adv.data.get("model") == model
-        }
+        return dict(self._adv_data_by_model.get(model, {}))
 
     async def get_curtains(self) -> dict[str, SwitchBotAdvertisement]:
         """Return all WoCurtain/Curtains devices with services data."""
@@ -109,12 +145,9 @@ class GetSwitchbotDevices:
         self, address: str
     ) -> dict[str, SwitchBotAdvertisement] | None:
         """Return data for specific device."""
-        if not self._adv_data:
-            await self.discover()
-
-        return {
-            device: adv
-            for device, adv in self._adv_data.items()
-            # MacOS uses UUIDs instead of MAC addresses
-            if adv.data.get("address") == address
-        }
+        await self._ensure_discovered()
+
+        # MacOS uses UUIDs instead of MAC addresses
+        if adv := self._adv_data.get(address):
+            return {address: adv}
+        return {}
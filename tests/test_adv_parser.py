@@ -4,7 +4,8 @@ from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
 from switchbot import SwitchbotModel
-from switchbot.adv_parser import parse_advertisement_data
+from switchbot.adv_parser import _parse_data, parse_advertisement_data
+from switchbot.const import LockStatus
 from switchbot.models import SwitchBotAdvertisement
 
 ADVERTISEMENT_DATA_DEFAULTS = {
@@ -827,6 +828,25 @@ def test_wosensor_passive_only():
     )
 
 
+def test_wosensor_negative_temperature():
+    """Test parsing wosensor with a temperature below zero."""
+    ble_device = BLEDevice("aa:bb:cc:dd:ee:ff", "any")
+    adv_data = generate_advertisement_data(
+        manufacturer_data={},
+        service_data={"0000fd3d-0000-1000-8000-00805f9b34fb": b"T\x00\xe4\x06\x185"},
+        tx_power=-127,
+        rssi=-50,
+    )
+    result = parse_advertisement_data(ble_device, adv_data)
+    assert result.data["data"] == {
+        "battery": 100,
+        "fahrenheit": False,
+        "humidity": 53,
+        "temp": {"c": -24.6, "f": -12.280000000000001},
+        "temperature": -24.6,
+    }
+
+
 def test_motion_sensor_clear():
     """Test parsing motion sensor with clear data."""
     ble_device = BLEDevice("aa:bb:cc:dd:ee:ff", "any")
@@ -1118,3 +1138,52 @@ def test_motion_sensor_motion_passive():
         rssi=-87,
         active=False,
     )
+
+
+def test_parse_advertisement_data_is_cached():
+    """Test a repeated advertisement payload is only parsed once."""
+    ble_device = BLEDevice("aa:bb:cc:dd:ee:ff", "any")
+    adv_data = generate_advertisement_data(
+        service_data={"0000fd3d-0000-1000-8000-00805f9b34fb": b"T\x00\xe4\x06\x986"},
+        rssi=-50,
+    )
+    _parse_data.cache_clear()
+    first = parse_advertisement_data(ble_device, adv_data)
+    second = parse_advertisement_data(ble_device, adv_data)
+    assert first == second
+    assert _parse_data.cache_info().hits == 1
+    assert _parse_data.cache_info().misses == 1
+
+
+def test_lock_passive():
+    """Test parsing lock with only manufacturer data."""
+    ble_device = BLEDevice("aa:bb:cc:dd:ee:ff", "any")
+    adv_data = generate_advertisement_data(
+        manufacturer_data={2409: b"\xf1\x80\x00\x00\x00\x00\x00\x10\x00\x00\x00"},
+        rssi=-67,
+    )
+    result = parse_advertisement_data(ble_device, adv_data, SwitchbotModel.LOCK)
+    assert result == SwitchBotAdvertisement(
+        address="aa:bb:cc:dd:ee:ff",
+        data={
+            "data": {
+                "battery": None,
+                "calibration": False,
+                "status": LockStatus.UNLOCKED,
+                "update_from_secondary_lock": False,
+                "door_open": False,
+                "double_lock_mode": False,
+                "unclosed_alarm": False,
+                "unlocked_alarm": False,
+                "auto_lock_paused": False,
+            },
+            "isEncrypted": False,
+            "model": "o",
+            "modelFriendlyName": "Lock",
+            "modelName": SwitchbotModel.LOCK,
+            "rawAdvData": None,
+        },
+        device=ble_device,
+        rssi=-67,
+        active=False,
+    )
@@ -0,0 +1,8 @@
+from switchbot.devices.curtain import _state_of_charge
+
+
+def test_state_of_charge():
+    """Test mapping of the raw charge state value."""
+    assert _state_of_charge(0) == "not_charging"
+    assert _state_of_charge(5) == "charging_error"
+    assert _state_of_charge(6) == "unknown"
@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from bleak.backends.device import BLEDevice
+
+from switchbot.devices import device as device_module
+from switchbot.devices.device import SwitchbotDevice
+from switchbot.discovery import GetSwitchbotDevices
+
+
+def test_get_device_data_shares_scan():
+    """Test devices on the same interface share one scan until it expires."""
+    device_module._SCAN_CACHE.clear()
+
+    async def _discover(*args, **kwargs) -> dict:
+        await asyncio.sleep(0)
+        return {}
+
+    async def _run():
+        first = SwitchbotDevice(BLEDevice("aa:bb:cc:dd:ee:01", "any"))
+        second = SwitchbotDevice(BLEDevice("aa:bb:cc:dd:ee:02", "any"))
+        with patch.object(
+            GetSwitchbotDevices, "discover", AsyncMock(side_effect=_discover)
+        ) as mock_discover:
+            await asyncio.gather(first.get_device_data(), second.get_device_data())
+            assert mock_discover.await_count == 1
+
+            timestamp, data = device_module._SCAN_CACHE[0]
+            device_module._SCAN_CACHE[0] = (
+                timestamp - first._scan_timeout - 1,
+                data,
+            )
+            await first.get_device_data()
+            assert mock_discover.await_count == 2
+
+    asyncio.run(_run())
+
+
+async def _create_device(**kwargs) -> SwitchbotDevice:
+    """Create a device while an event loop is running."""
+    return SwitchbotDevice(BLEDevice("aa:bb:cc:dd:ee:01", "any"), **kwargs)
+
+
+def test_commandkey_without_password():
+    """Test the command key is sent as is without a password."""
+    device = asyncio.run(_create_device())
+    assert device._commandkey("570101") == b"\x57\x01\x01"
+
+
+def test_commandkey_with_password():
+    """Test the encoded password is spliced into the command key."""
+    device = asyncio.run(_create_device(password="test"))
+    assert device._commandkey("570101") == b"\x57\x11\xd8\x7f\x7e\x0c\x01"
+    assert (
+        device._commandkey("570f4501010164")
+        == b"\x57\x1f\xd8\x7f\x7e\x0c\x45\x01\x01\x01\x64"
+    )
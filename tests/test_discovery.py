@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from bleak import BleakError
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from switchbot.discovery import GetSwitchbotDevices
+
+from test_adv_parser import generate_advertisement_data
+
+BOT_DEVICE = BLEDevice("aa:bb:cc:dd:ee:01", "any")
+BOT_ADV = generate_advertisement_data(
+    service_data={"00000d00-0000-1000-8000-00805f9b34fb": b"H\x10\xe1"},
+)
+CURTAIN_DEVICE = BLEDevice("aa:bb:cc:dd:ee:02", "any")
+CURTAIN_ADV = generate_advertisement_data(
+    service_data={"0000fd3d-0000-1000-8000-00805f9b34fb": b"c\xc0X\x00\x11\x04"},
+)
+ADVERTISEMENTS = [(BOT_DEVICE, BOT_ADV), (CURTAIN_DEVICE, CURTAIN_ADV)]
+
+
+class FakeAdapter:
+    """Hand out scanners that share a failure budget and start counter."""
+
+    def __init__(
+        self,
+        failures: int = 0,
+        advertisements: list[tuple[BLEDevice, AdvertisementData]] = ADVERTISEMENTS,
+    ) -> None:
+        self.failures = failures
+        self.advertisements = advertisements
+        self.start_calls = 0
+
+    def __call__(self, detection_callback: Any = None, **kwargs: Any) -> FakeScanner:
+        return FakeScanner(self, detection_callback)
+
+
+class FakeScanner:
+    """Scanner that reports the adapter's advertisements when started."""
+
+    def __init__(self, adapter: FakeAdapter, detection_callback: Any) -> None:
+        self._adapter = adapter
+        self._callback = detection_callback
+
+    async def start(self) -> None:
+        self._adapter.start_calls += 1
+        if self._adapter.start_calls <= self._adapter.failures:
+            raise BleakError("scan failed")
+        for device, advertisement_data in self._adapter.advertisements:
+            self._callback(device, advertisement_data)
+
+    async def stop(self) -> None:
+        pass
+
+
+def _discover(adapter: FakeAdapter, retry: int = 3) -> tuple[GetSwitchbotDevices, dict]:
+    """Run a discovery against the fake adapter."""
+    get_devices = GetSwitchbotDevices()
+    with patch("switchbot.discovery.bleak.BleakScanner", adapter), patch(
+        "switchbot.discovery.DEFAULT_RETRY_TIMEOUT", 0
+    ):
+        result = asyncio.run(get_devices.discover(retry=retry, scan_timeout=0))
+    return get_devices, result
+
+
+def test_discover_collects_advertisements():
+    """Test advertisements seen during the scan are parsed afterwards."""
+    _, result = _discover(FakeAdapter())
+    assert set(result) == {BOT_DEVICE.address, CURTAIN_DEVICE.address}
+    assert result[BOT_DEVICE.address].data["model"] == "H"
+    assert result[CURTAIN_DEVICE.address].data["model"] == "c"
+
+
+def test_discover_keeps_advertisement_with_switchbot_data():
+    """Test a later advertisement without SwitchBot data does not drop a device."""
+    adapter = FakeAdapter(
+        advertisements=[
+            (BOT_DEVICE, BOT_ADV),
+            (BOT_DEVICE, generate_advertisement_data(rssi=-60)),
+        ]
+    )
+    _, result = _discover(adapter)
+    assert set(result) == {BOT_DEVICE.address}
+    assert result[BOT_DEVICE.address].data["model"] == "H"
+
+
+def test_get_device_data_by_address():
+    """Test looking up a single device by address."""
+    get_devices, result = _discover(FakeAdapter())
+    assert asyncio.run(get_devices.get_device_data(BOT_DEVICE.address)) == {
+        BOT_DEVICE.address: result[BOT_DEVICE.address]
+    }
+    assert asyncio.run(get_devices.get_device_data("aa:bb:cc:dd:ee:ff")) == {}
+
+
+def test_get_devices_by_model():
+    """Test devices are returned by model."""
+    get_devices, result = _discover(FakeAdapter())
+    assert asyncio.run(get_devices.get_bots()) == {
+        BOT_DEVICE.address: result[BOT_DEVICE.address]
+    }
+    assert asyncio.run(get_devices.get_curtains()) == {
+        CURTAIN_DEVICE.address: result[CURTAIN_DEVICE.address]
+    }
+    assert asyncio.run(get_devices.get_tempsensors()) == {}
+
+
+def test_concurrent_get_calls_share_one_discovery():
+    """Test concurrent get_* calls run a single discovery."""
+    get_devices = GetSwitchbotDevices()
+
+    async def _discover(*args: Any, **kwargs: Any) -> dict:
+        await asyncio.sleep(0)
+        get_devices._discovered = True
+        return {}
+
+    async def _run():
+        with patch.object(get_devices, "discover", AsyncMock(side_effect=_discover)):
+            await asyncio.gather(
+                get_devices.get_bots(),
+                get_devices.get_curtains(),
+                get_devices.get_tempsensors(),
+                get_devices.get_device_data("aa:bb:cc:dd:ee:ff"),
+            )
+            return get_devices.discover.await_count
+
+    assert asyncio.run(_run()) == 1
+
+
+def test_discover_retries_failed_scan():
+    """Test a failing scan is retried and the data is still returned."""
+    adapter = FakeAdapter(failures=2)
+    _, result = _discover(adapter, retry=3)
+    assert adapter.start_calls == 3
+    assert set(result) == {BOT_DEVICE.address, CURTAIN_DEVICE.address}
+
+
+def test_discover_gives_up_after_retries():
+    """Test discover stops retrying and returns instead of raising."""
+    adapter = FakeAdapter(failures=10)
+    _, result = _discover(adapter, retry=2)
+    assert adapter.start_calls == 3
+    assert result == {}
+
+
+def test_failed_discovery_is_retried_on_next_call():
+    """Test a discovery where every attempt failed runs again on the next call."""
+    adapter = FakeAdapter(failures=4)
+    get_devices, result = _discover(adapter, retry=3)
+    assert result == {}
+    assert adapter.start_calls == 4
+
+    with patch("switchbot.discovery.bleak.BleakScanner", adapter), patch(
+        "switchbot.discovery.asyncio.sleep", AsyncMock()
+    ):
+        bots = asyncio.run(get_devices.get_bots())
+    assert adapter.start_calls == 5
+    assert bots == {BOT_DEVICE.address: get_devices._adv_data[BOT_DEVICE.address]}